@@ -11,6 +11,8 @@ from PIL import Image, ImageTk
 import sympy as sp
 import matplotlib.animation as animation
 import pandas as pd  # ← ВАЖНО: добавлен отсутствующий импорт
+import profiler
+import series
 
 
 # Настройка бэкенда для matplotlib
@@ -303,6 +305,11 @@ class SeriesAnalyzerApp:
         settings_menu.add_command(label="Настройки графиков", command=self.graph_settings)
         menubar.add_cascade(label="Настройки", menu=settings_menu)
 
+        # Меню Анализ
+        analysis_menu = tk.Menu(menubar, tearoff=0)
+        analysis_menu.add_command(label="Профилирование методов", command=self.profile_methods)
+        menubar.add_cascade(label="Анализ", menu=analysis_menu)
+
         # Меню Помощь
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="Справка", command=self.show_help)
@@ -322,19 +329,7 @@ class SeriesAnalyzerApp:
 
     def partial_sum(self, x, n_terms):
         """Вычисление частичной суммы ряда."""
-        if abs(x) > 1 / e:
-            return float('nan')
-
-        total = 0.0
-        term = x  # Первый член (n=1)
-
-        for n in range(1, n_terms + 1):
-            if n == 1:
-                term = x
-            else:
-                term = term * x * (1 - 1 / n) ** (n - 1)
-            total += term
-        return total
+        return series.partial_sum(x, n_terms)
 
     def slider_changed(self, slider_type):
         """Обработчик изменения слайдеров"""
@@ -498,6 +493,52 @@ class SeriesAnalyzerApp:
                 messagebox.showerror("Ошибка", f"Не удалось экспортировать данные: {str(e)}")
                 self.status_var.set("Ошибка при экспорте")
 
+    def profile_methods(self):
+        """Сравнение методов вычисления ряда по точности и времени"""
+        self.status_var.set("Профилирование методов...")
+        self.root.update()
+
+        # Сетка по текущему диапазону, ограниченному интервалом сходимости
+        x_lo = max(self.x_min, -0.95 / e)
+        x_hi = min(self.x_max, 0.95 / e)
+        if x_lo >= x_hi:
+            messagebox.showerror("Ошибка", "Диапазон x не пересекается с интервалом сходимости")
+            self.status_var.set("Готово")
+            return
+
+        results = profiler.profile_methods(np.linspace(x_lo, x_hi, 21))
+        summary = profiler.pareto_table(results)
+
+        profile_window = tk.Toplevel(self.root)
+        profile_window.title("Профилирование методов")
+        profile_window.geometry("900x800")
+
+        figure = plt.Figure(figsize=(8, 5), dpi=100)
+        ax = figure.add_subplot(111)
+        profiler.plot_pareto(summary, ax)
+        figure.tight_layout()
+        canvas = FigureCanvasTkAgg(figure, master=profile_window)
+        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        canvas.draw()
+
+        table = tk.Text(profile_window, height=14, font=('Courier', 9))
+        table.insert(tk.END, summary.to_string(index=False))
+        table.config(state=tk.DISABLED)
+        table.pack(fill=tk.X, padx=10, pady=5)
+
+        def save_results():
+            filetypes = [('CSV File', '*.csv'), ('All Files', '*.*')]
+            filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=filetypes)
+            if filename:
+                try:
+                    summary.to_csv(filename, index=False)
+                    self.status_var.set(f"Результаты профилирования сохранены в {filename}")
+                except Exception as e:
+                    messagebox.showerror("Ошибка", f"Не удалось сохранить результаты: {str(e)}")
+
+        ttk.Button(profile_window, text="Экспорт таблицы", command=save_results).pack(pady=5)
+        self.status_var.set("Готово")
+
     def toggle_animation(self):
         """Включение/выключение анимации"""
         if not self.animation_running:
@@ -0,0 +1,247 @@
+"""Профилирование способов вычисления ряда: точность против стоимости.
+
+Сравнивает рекуррентное суммирование ряда -W(-x) в float64, компенсированное
+суммирование math.fsum, суммирование в mpmath с повышенной точностью и
+замкнутую форму через W-функцию Ламберта. Отдельной строкой
+``partial_sum (как есть)`` замеряется рекуррентность, которой пользуется
+приложение. Для каждого x из интервала сходимости и каждого допуска
+измеряются время, число членов и фактическая ошибка относительно эталона
+mpmath.
+
+Запуск без GUI:
+    python profiler.py --points 21 --tol 1e-6 1e-10 1e-14 --out profile
+"""
+import argparse
+import math
+import time
+from math import e
+
+import numpy as np
+import pandas as pd
+import mpmath
+from scipy.special import lambertw
+
+import series
+
+
+REFERENCE_DPS = 50  # Точность эталонного значения (десятичных знаков)
+SUMMATION_DPS = 30  # Рабочая точность метода mpmath
+DEFAULT_TOLERANCES = (1e-6, 1e-10, 1e-14)
+
+
+def reference_value(x):
+    """Эталонное значение -W(-x), вычисленное mpmath с повышенной точностью."""
+    with mpmath.workdps(REFERENCE_DPS):
+        return -mpmath.lambertw(-mpmath.mpf(x))
+
+
+def _converged(term, q, tol):
+    """Хвост после a_n не превосходит |a_n| q / (1 - q), где q — оценка сверху
+    для |a_(k+1) / a_k|; сравниваем эту оценку с допуском."""
+    if q >= 1:
+        return False
+    return abs(term) * q / (1 - q) <= tol
+
+
+def _terms(x, tol, max_terms, ratio, q, one=1):
+    """Члены ряда по рекуррентности ``ratio`` до выполнения критерия остановки."""
+    term = one * x
+    yield term
+    for n in range(2, max_terms + 1):
+        if _converged(term, q, tol):
+            return
+        term = term * ratio(x, n, one)
+        yield term
+
+
+def sum_float64(x, tol, max_terms):
+    """Суммирование ряда -W(-x) в float64; |a_n / a_(n-1)| < |x|e."""
+    total = 0.0
+    n = 0
+    for n, term in enumerate(_terms(x, tol, max_terms, series.lambert_ratio, abs(x) * e), 1):
+        total += term
+    return total, n
+
+
+def sum_fsum(x, tol, max_terms):
+    """Та же рекуррентность, но с компенсированным суммированием math.fsum."""
+    terms = list(_terms(x, tol, max_terms, series.lambert_ratio, abs(x) * e))
+    return math.fsum(terms), len(terms)
+
+
+def sum_mpmath(x, tol, max_terms):
+    """Суммирование ряда -W(-x) в арифметике mpmath повышенной точности."""
+    with mpmath.workdps(SUMMATION_DPS):
+        total = mpmath.mpf(0)
+        n = 0
+        for n, term in enumerate(_terms(x, tol, max_terms, series.lambert_ratio,
+                                        abs(x) * e, mpmath.mpf(1)), 1):
+            total += term
+        return total, n
+
+
+def sum_partial_sum(x, tol, max_terms):
+    """Рекуррентность partial_sum как есть (float64); |a_n / a_(n-1)| <= |x|/2.
+
+    Суммирует n! x^n / n^n, а не ряд -W(-x), поэтому её ошибка относительно
+    эталона не убывает с допуском — строка показывает текущее поведение
+    приложения.
+    """
+    total = 0.0
+    n = 0
+    for n, term in enumerate(_terms(x, tol, max_terms, series.partial_sum_ratio, abs(x) / 2), 1):
+        total += term
+    return total, n
+
+
+def closed_form(x, tol, max_terms):
+    """Замкнутая форма -W(-x) через scipy; члены ряда не суммируются."""
+    if x == 0:
+        return 0.0, 0
+    return -lambertw(-x).real, 0
+
+
+METHODS = {
+    'float64': sum_float64,
+    'fsum': sum_fsum,
+    'mpmath': sum_mpmath,
+    'lambertw': closed_form,
+    'partial_sum (как есть)': sum_partial_sum,
+}
+
+# Методы, результат которых не зависит от допуска: замеряются один раз (tol = NaN)
+TOLERANCE_FREE = {'lambertw'}
+
+
+def profile_methods(x_values, tolerances=DEFAULT_TOLERANCES, methods=None,
+                    max_terms=2000, repeats=5):
+    """Замер времени, числа членов и ошибки для каждого метода, x и допуска.
+
+    Время — минимум из ``repeats`` запусков. Возвращает DataFrame с одной
+    строкой на сочетание (method, tol, x); для методов из TOLERANCE_FREE
+    tol равен NaN, а met_tol — None (допуск не проверялся).
+    """
+    if methods is None:
+        methods = list(METHODS)
+
+    references = {x: reference_value(x) for x in x_values}
+    rows = []
+    for name in methods:
+        func = METHODS[name]
+        method_tols = [float('nan')] if name in TOLERANCE_FREE else tolerances
+        for tol in method_tols:
+            for x in x_values:
+                best = float('inf')
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    value, terms = func(x, tol, max_terms)
+                    best = min(best, time.perf_counter() - start)
+                with mpmath.workdps(REFERENCE_DPS):
+                    error = float(abs(mpmath.mpf(value) - references[x]))
+                rows.append({
+                    'method': name,
+                    'tol': tol,
+                    'x': x,
+                    'time_s': best,
+                    'terms': terms,
+                    'error': error,
+                    'met_tol': bool(error <= tol) if not np.isnan(tol) else None,
+                })
+    return pd.DataFrame(rows)
+
+
+def _all_or_none(values):
+    """Все ли проверки допуска пройдены; None, если допуск не проверялся."""
+    if values.isna().any():
+        return None
+    return bool(values.all())
+
+
+def pareto_table(results):
+    """Сводка по (method, tol) с отметкой Парето-оптимальных вариантов.
+
+    Вариант оптимален, если никакой другой не быстрее и не точнее
+    одновременно (сравниваются среднее время и максимальная ошибка).
+    """
+    summary = (results.groupby(['method', 'tol'], sort=False, dropna=False)
+               .agg(time_s=('time_s', 'mean'),
+                    terms=('terms', 'mean'),
+                    max_error=('error', 'max'),
+                    mean_error=('error', 'mean'),
+                    met_tol=('met_tol', _all_or_none))
+               .reset_index())
+
+    times = summary['time_s'].to_numpy()
+    errors = summary['max_error'].to_numpy()
+    pareto = []
+    for i in range(len(summary)):
+        dominated = np.any((times <= times[i]) & (errors <= errors[i]) &
+                           ((times < times[i]) | (errors < errors[i])))
+        pareto.append(not dominated)
+    summary['pareto'] = pareto
+    return summary.sort_values('time_s').reset_index(drop=True)
+
+
+def plot_pareto(summary, ax):
+    """Диаграмма «время — ошибка» с линией Парето-фронта.
+
+    Нулевая ошибка не отображается на логарифмической шкале, поэтому
+    ошибки ограничиваются снизу значением np.finfo(float).tiny.
+    """
+    summary = summary.assign(max_error=summary['max_error'].clip(lower=np.finfo(float).tiny))
+    for name, group in summary.groupby('method', sort=False):
+        ax.scatter(group['time_s'], group['max_error'], label=name)
+        for _, row in group.iterrows():
+            if np.isnan(row['tol']):
+                continue
+            ax.annotate(f"{row['tol']:.0e}", (row['time_s'], row['max_error']),
+                        fontsize=7, xytext=(3, 3), textcoords='offset points')
+
+    front = summary[summary['pareto']].sort_values('time_s')
+    ax.step(front['time_s'], front['max_error'], where='post',
+            color='r', linestyle='--', alpha=0.6, label='Парето-фронт')
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_title('Точность против стоимости')
+    ax.set_xlabel('Среднее время вычисления, с')
+    ax.set_ylabel('Макс. абсолютная ошибка')
+    ax.legend()
+
+
+def sweep_x(points, margin=0.95):
+    """Равномерная сетка по интервалу сходимости без граничных точек ±1/e."""
+    return np.linspace(-margin / e, margin / e, points)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Профилирование методов вычисления ряда")
+    parser.add_argument('--points', type=int, default=21, help="число точек x в интервале сходимости")
+    parser.add_argument('--margin', type=float, default=0.95, help="доля радиуса сходимости 1/e")
+    parser.add_argument('--tol', type=float, nargs='+', default=list(DEFAULT_TOLERANCES),
+                        help="допуски для остановки суммирования")
+    parser.add_argument('--max-terms', type=int, default=2000, help="предел числа членов ряда")
+    parser.add_argument('--repeats', type=int, default=5, help="повторы замера времени")
+    parser.add_argument('--out', default='profile', help="префикс выходных файлов (CSV и PNG)")
+    args = parser.parse_args()
+
+    results = profile_methods(sweep_x(args.points, args.margin), args.tol,
+                              max_terms=args.max_terms, repeats=args.repeats)
+    summary = pareto_table(results)
+
+    results.to_csv(f"{args.out}_raw.csv", index=False)
+    summary.to_csv(f"{args.out}_pareto.csv", index=False)
+    print(summary.to_string(index=False))
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    plot_pareto(summary, ax)
+    fig.tight_layout()
+    fig.savefig(f"{args.out}_pareto.png", dpi=150)
+
+
+if __name__ == "__main__":
+    main()
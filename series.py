@@ -0,0 +1,42 @@
+"""Рекуррентные соотношения для членов ряда.
+
+Общий модуль для приложения (partial_sum) и профилировщика, чтобы обе
+стороны вычисляли члены ряда одним и тем же кодом.
+
+Параметр ``one`` задаёт арифметику: по умолчанию 1 (float64), для
+повышенной точности передаётся mpmath.mpf(1).
+"""
+from math import e
+
+
+def lambert_ratio(x, n, one=1):
+    """Отношение a_n / a_(n-1) для a_n = n^(n-1) x^n / n!, сумма ряда равна -W(-x).
+
+    Множитель (n / (n - 1))^(n - 2) = (1 + 1/m)^(m - 1) при m = n - 1 не
+    превосходит (1 + 1/m)^m < e, поэтому |a_n / a_(n-1)| < |x|e.
+    """
+    return x * (one * n / (n - 1)) ** (n - 2)
+
+
+def partial_sum_ratio(x, n, one=1):
+    """Отношение соседних членов в рекуррентности partial_sum.
+
+    Множитель (1 - 1/n)^(n - 1) убывает от 1/2 (n = 2) к 1/e, поэтому
+    |a_n / a_(n-1)| <= |x| / 2. Такая рекуррентность суммирует n! x^n / n^n.
+    """
+    return x * (1 - one / n) ** (n - 1)
+
+
+def partial_sum(x, n_terms):
+    """Вычисление частичной суммы ряда."""
+    if abs(x) > 1 / e:
+        return float('nan')
+
+    total = 0.0
+    term = x  # Первый член (n=1)
+
+    for n in range(1, n_terms + 1):
+        if n > 1:
+            term = term * partial_sum_ratio(x, n)
+        total += term
+    return total